@@ -0,0 +1,192 @@
+import enum
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import select, func, case
+from sqlalchemy.orm import Session
+
+from models import Resume, CandidateProfile, JobPost, JobApplication, ResumeInteraction
+from database import get_db
+
+# orjson is optional and not part of the project's environment; without it the
+# stdlib encoder is used
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        # SUM() comes back as DECIMAL on MySQL
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    # Handlers return this directly so FastAPI skips jsonable_encoder on the rows
+    def render(self, content) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=_default)
+        return json.dumps(content, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+router = APIRouter(prefix="/api/v1", default_response_class=FastJSONResponse)
+
+# Page size for the list endpoints
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+# Columns each resource exposes through `fields=`
+JOB_FIELDS = {
+    "id": JobPost.id,
+    "company_name": JobPost.company_name,
+    "job_title": JobPost.job_title,
+    "description": JobPost.description,
+    "skills": JobPost.skills,
+    "job_type": JobPost.job_type,
+}
+JOB_DEFAULT_FIELDS = ["id", "company_name", "job_title", "skills", "job_type"]
+
+APPLICATION_FIELDS = {
+    "id": JobApplication.id,
+    "name": JobApplication.name,
+    "email": JobApplication.email,
+    "resume_link": JobApplication.resume_link,
+    "job_id": JobApplication.job_id,
+    "job_title": JobPost.job_title,
+    "company_name": JobPost.company_name,
+}
+APPLICATION_DEFAULT_FIELDS = ["id", "job_id", "job_title", "name", "email", "resume_link"]
+
+PROFILE_FIELDS = {
+    "id": CandidateProfile.id,
+    "candidate_id": CandidateProfile.candidate_id,
+    "name": CandidateProfile.name,
+    "education": CandidateProfile.education,
+    "skills": CandidateProfile.skills,
+    "experience": CandidateProfile.experience,
+    "linkedin": CandidateProfile.linkedin,
+    "github": CandidateProfile.github,
+    "phone_number": CandidateProfile.phone_number,
+    "photo_url": CandidateProfile.photo_url,
+}
+PROFILE_DEFAULT_FIELDS = ["id", "name", "linkedin", "github", "phone_number", "photo_url"]
+
+# View/download counts are aggregated over the outer join of resumes to interactions
+RESUME_INSIGHT_FIELDS = {
+    "id": Resume.id,
+    "title": Resume.title,
+    "file_path": Resume.file_path,
+    "views": func.sum(case((ResumeInteraction.interaction_type == "view", 1), else_=0)),
+    "downloads": func.sum(case((ResumeInteraction.interaction_type == "download", 1), else_=0)),
+    "last_interaction": func.max(ResumeInteraction.timestamp),
+}
+RESUME_INSIGHT_AGGREGATE_FIELDS = {"views", "downloads", "last_interaction"}
+RESUME_INSIGHT_DEFAULT_FIELDS = ["id", "title", "views", "downloads", "last_interaction"]
+
+
+def parse_fields(fields, allowed, default):
+    """Turn a comma separated `fields=` value into the list of requested names."""
+    if not fields:
+        return default
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    # Drop duplicates while keeping the requested order
+    return list(dict.fromkeys(names)) or default
+
+
+def projection(names, allowed):
+    return select(*[allowed[name].label(name) for name in names])
+
+
+def rows_to_dicts(names, rows):
+    return [dict(zip(names, row)) for row in rows]
+
+
+@router.get("/jobs")
+def api_list_jobs(
+        fields: Optional[str] = None,
+        limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        offset: int = Query(0, ge=0),
+        db: Session = Depends(get_db)
+):
+    names = parse_fields(fields, JOB_FIELDS, JOB_DEFAULT_FIELDS)
+    query = projection(names, JOB_FIELDS).order_by(JobPost.id).limit(limit).offset(offset)
+    rows = db.execute(query).all()
+    return FastJSONResponse({"jobs": rows_to_dicts(names, rows)})
+
+
+@router.get("/applications")
+def api_list_applications(
+        request: Request,
+        fields: Optional[str] = None,
+        limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        offset: int = Query(0, ge=0),
+        db: Session = Depends(get_db)
+):
+    recruiter_id = request.session.get('user_id')
+    if not recruiter_id or request.session.get('user_role') != "recruiter":
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    names = parse_fields(fields, APPLICATION_FIELDS, APPLICATION_DEFAULT_FIELDS)
+    # One joined query instead of one query per job post
+    query = (
+        projection(names, APPLICATION_FIELDS)
+        .select_from(JobApplication)
+        .join(JobPost, JobApplication.job_id == JobPost.id)
+        .where(JobPost.recruiter_id == recruiter_id)
+        .order_by(JobApplication.job_id, JobApplication.id)
+        .limit(limit)
+        .offset(offset)
+    )
+    rows = db.execute(query).all()
+    return FastJSONResponse({"applications": rows_to_dicts(names, rows)})
+
+
+@router.get("/profile")
+def api_profile(request: Request, fields: Optional[str] = None, db: Session = Depends(get_db)):
+    candidate_id = request.session.get('user_id')
+    if not candidate_id or request.session.get('user_role') != "candidate":
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    names = parse_fields(fields, PROFILE_FIELDS, PROFILE_DEFAULT_FIELDS)
+    query = projection(names, PROFILE_FIELDS).where(CandidateProfile.candidate_id == candidate_id)
+    row = db.execute(query).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FastJSONResponse({"profile": dict(zip(names, row))})
+
+
+@router.get("/resume_insights")
+def api_resume_insights(request: Request, fields: Optional[str] = None, db: Session = Depends(get_db)):
+    candidate_id = request.session.get('user_id')
+    if not candidate_id or request.session.get('user_role') != "candidate":
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    names = parse_fields(fields, RESUME_INSIGHT_FIELDS, RESUME_INSIGHT_DEFAULT_FIELDS)
+    query = (
+        projection(names, RESUME_INSIGHT_FIELDS)
+        .select_from(Resume)
+        .where(Resume.candidate_id == candidate_id)
+        .order_by(Resume.id)
+    )
+    # Only join interactions when a count is requested, and only for this candidate's resumes
+    if RESUME_INSIGHT_AGGREGATE_FIELDS.intersection(names):
+        query = (
+            query
+            .outerjoin(ResumeInteraction, ResumeInteraction.resume_id == Resume.id)
+            .group_by(Resume.id)
+        )
+    rows = db.execute(query).all()
+    return FastJSONResponse({"resume_insights": rows_to_dicts(names, rows)})
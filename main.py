@@ -18,6 +18,7 @@ from starlette.responses import FileResponse
 import models
 from models import Recruiter, Candidate, Resume, CandidateProfile, JobPost, JobType, JobApplication, ResumeInteraction
 from database import engine, Base, get_db
+from api import router as api_router
 
 app = FastAPI()
 
@@ -35,6 +36,9 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 
 templates = Jinja2Templates(directory="templates")
 
+# JSON read API (/api/v1)
+app.include_router(api_router)
+
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})